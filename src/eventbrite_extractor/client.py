@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import logging
-import time
+import random
+from itertools import takewhile
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from eventbrite_extractor.config import (
     BASE_URL,
@@ -16,6 +19,11 @@ from eventbrite_extractor.config import (
 )
 from eventbrite_extractor.models import Event
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Fields to expand in the destination/search response
@@ -26,6 +34,80 @@ _EXPAND_FIELDS = [
     "ticket_availability",
 ]
 
+# Upper bound on any single retry wait, including server-sent Retry-After
+_MAX_RETRY_DELAY = 30.0
+# Backoff is stretched by up to this fraction, so clients that failed
+# together do not retry in lockstep
+_BACKOFF_JITTER = 0.5
+# Seconds of random delay added on top of a server-sent Retry-After
+_RETRY_AFTER_JITTER = 2.0
+
+
+class _CappedRetry(Retry):
+    """urllib3 retry policy with jittered, capped delays on every retry.
+
+    Unlike stock urllib3, which retries the first failure immediately,
+    backoff starts at ``backoff_factor`` seconds on the first retry.
+    ``Retry-After`` is clamped to ``_MAX_RETRY_DELAY`` and jittered too.
+    Each retry is logged at WARNING, since urllib3 itself only logs
+    retries at DEBUG.
+    """
+
+    def get_backoff_time(self) -> float:
+        # Count only the latest run of consecutive errors, as urllib3 does
+        errors = len(
+            list(
+                takewhile(lambda h: h.redirect_location is None, reversed(self.history))
+            )
+        )
+        if not errors:
+            return 0.0
+        wait = min(_MAX_RETRY_DELAY, self.backoff_factor * 2 ** (errors - 1))
+        return wait * (1 + random.uniform(0, _BACKOFF_JITTER))
+
+    def get_retry_after(self, response) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _MAX_RETRY_DELAY) + random.uniform(
+            0, _RETRY_AFTER_JITTER
+        )
+
+    def increment(self, method=None, url=None, response=None, error=None, **kwargs):
+        # Raises MaxRetryError once retries are exhausted, so only
+        # requests that will actually be retried are logged
+        retry = super().increment(method, url, response, error, **kwargs)
+        if response is not None and response.status == 429:
+            logger.warning("Rate limited. Retrying (%s attempts left)...", retry.total)
+        elif error is not None or response is not None:
+            logger.warning(
+                "Request to %s failed (%s). Retrying (%s attempts left)...",
+                url,
+                error or f"HTTP {response.status}",
+                retry.total,
+            )
+        return retry
+
+
+# Retry rate-limited (429) and server error (5xx) responses, plus
+# transient connection errors, with jittered exponential backoff. The
+# destination/search POST is a read, so it is safe to retry.
+_RETRY = _CappedRetry(
+    total=3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST"}),
+    backoff_factor=1.0,
+    respect_retry_after_header=True,
+    # Hand the final response back so raise_for_status raises HTTPError
+    raise_on_status=False,
+)
+
+# Connection pool shared by all client instances so keep-alive TCP/TLS
+# connections are reused across clients, not just across pages. Only the
+# adapter is shared: each client has its own Session, so cookies and other
+# session state never leak between clients using different tokens.
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_RETRY)
+
 
 class EventbriteClient:
     """Client for the Eventbrite destination/search API.
@@ -43,17 +125,16 @@ class EventbriteClient:
         """
         self._api_key = api_key or get_api_key()
         self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Authorization": f"Bearer {self._api_key}",
-                "Content-Type": "application/json",
-            }
-        )
-
-    _MAX_RETRIES = 3
+        self._session.mount("https://", _ADAPTER)
+        # Content-Type is left to requests, which sets it only when a JSON
+        # body is sent.
+        self._headers = {"Authorization": f"Bearer {self._api_key}"}
 
     def _request(self, method: str, endpoint: str, **kwargs) -> dict:
-        """Make an API request with rate-limit retry and exponential backoff.
+        """Make an API request.
+
+        Rate-limited (429) and server error (5xx) responses are retried
+        by the session's connection adapter (see ``_RETRY``).
 
         Args:
             method: HTTP method ("GET" or "POST").
@@ -65,24 +146,24 @@ class EventbriteClient:
 
         Raises:
             requests.HTTPError: If the request fails after retries.
+            requests.JSONDecodeError: If the response body is not valid JSON.
         """
         url = f"{BASE_URL}{endpoint}"
         kwargs.setdefault("timeout", REQUEST_TIMEOUT)
-
-        for attempt in range(self._MAX_RETRIES + 1):
-            response = self._session.request(method, url, **kwargs)
-
-            if response.status_code == 429 and attempt < self._MAX_RETRIES:
-                wait = int(response.headers.get("Retry-After", 2**attempt))
-                logger.warning("Rate limited. Retrying in %d seconds...", wait)
-                time.sleep(wait)
-                continue
-
-            response.raise_for_status()
-            return response.json()
-
-        # Unreachable, but keeps the type checker happy
-        raise RuntimeError("Exhausted retries")  # pragma: no cover
+        kwargs["headers"] = {**self._headers, **kwargs.get("headers", {})}
+
+        response = self._session.request(method, url, **kwargs)
+        response.raise_for_status()
+        if orjson is not None:
+            # Decode the raw bytes directly, skipping requests'
+            # charset detection and the stdlib decoder
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError as e:
+                # Raise what response.json() would, so callers catching
+                # requests.RequestException still see bad bodies
+                raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+        return response.json()
 
     def _post(self, endpoint: str, body: dict) -> dict:
         """POST to the Eventbrite API."""
@@ -134,8 +215,8 @@ class EventbriteClient:
             "expand.destination_event": _EXPAND_FIELDS,
         }
 
-        all_events: list[Event] = []
-        seen_ids: set[str] = set()
+        # Keyed by raw event ID; dicts preserve insertion order
+        events_by_id: dict[str, Event] = {}
 
         for page_num in range(1, max_pages + 1):
             logger.info("Fetching page %d...", page_num)
@@ -149,10 +230,10 @@ class EventbriteClient:
                 break
 
             for raw in raw_events:
-                event = Event.from_api_response(raw)
-                if event.event_id not in seen_ids:
-                    seen_ids.add(event.event_id)
-                    all_events.append(event)
+                # Skip duplicates before paying for a full parse
+                raw_id = raw.get("id", "")
+                if raw_id not in events_by_id:
+                    events_by_id[raw_id] = Event.from_api_response(raw)
 
             # Check for next page via continuation token
             pagination = events_data.get("pagination", {})
@@ -166,8 +247,8 @@ class EventbriteClient:
             event_search["continuation"] = continuation
             body["event_search"] = event_search
 
-        logger.info("Extracted %d unique events.", len(all_events))
-        return all_events
+        logger.info("Extracted %d unique events.", len(events_by_id))
+        return list(events_by_id.values())
 
     def get_event_by_id(self, event_id: str) -> Event:
         """Fetch a single event by its Eventbrite ID.
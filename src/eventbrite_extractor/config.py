@@ -1,21 +1,35 @@
 """Configuration and environment variable management."""
 
+import functools
 import os
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-# Load .env from the project root
+# .env in the project root, loaded lazily on first key lookup
 _env_path = Path(__file__).resolve().parents[2] / ".env"
-load_dotenv(_env_path)
+_dotenv_loaded = False
 
 
+def _ensure_env() -> None:
+    """Load the project .env file once per process."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv(_env_path)
+        _dotenv_loaded = True
+
+
+@functools.lru_cache(maxsize=1)
 def get_api_key() -> str:
     """Return the Eventbrite private token from environment variables.
 
+    The result is cached after the first successful lookup; call
+    ``get_api_key.cache_clear()`` to pick up a changed environment.
+
     Raises:
         ValueError: If EVENTBRITE_API_KEY is not set.
     """
+    _ensure_env()
     key = os.getenv("EVENTBRITE_API_KEY")
     if not key:
         raise ValueError(
@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 import csv
+import gzip
 import json
 import logging
+import math
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Union
+from typing import IO, Callable, Union
 
 from eventbrite_extractor.models import Event
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Accept either Event objects or plain dicts (enriched data from transform)
@@ -21,15 +31,110 @@ def _to_dict(item: EventData) -> dict:
     return item.to_dict() if isinstance(item, Event) else item
 
 
+def _ensure_parent(filepath: Path) -> None:
+    """Create the parent directory of ``filepath`` if it is missing."""
+    parent = filepath.parent
+    # One stat in the common case; mkdir(exist_ok=True) on an existing
+    # directory costs a failed mkdir plus a stat
+    if not parent.is_dir():
+        parent.mkdir(parents=True, exist_ok=True)
+
+
+def _row_getter(fieldnames: list[str]) -> Callable[[dict], tuple]:
+    """Return a callable that extracts ``fieldnames`` from a row as a tuple."""
+    # itemgetter needs at least one key, and returns a bare value for one
+    if not fieldnames:
+        return lambda row: ()
+    if len(fieldnames) == 1:
+        key = fieldnames[0]
+        return lambda row: (row[key],)
+    return itemgetter(*fieldnames)
+
+
+def _irregular_row(row: dict, fieldnames: list[str], fieldset: frozenset) -> list:
+    """Extract a row whose keys differ from the header, like ``DictWriter``.
+
+    Missing columns are left empty; keys not in the header raise.
+    """
+    wrong_fields = [k for k in row if k not in fieldset]
+    if wrong_fields:
+        raise ValueError(
+            "dict contains fields not in fieldnames: "
+            + ", ".join(repr(k) for k in wrong_fields)
+        )
+    return [
+        ", ".join(v) if isinstance(v, list) else v
+        for v in (row.get(k, "") for k in fieldnames)
+    ]
+
+
+def _has_non_finite(value) -> bool:
+    """Return True if ``value`` contains a NaN or infinite float."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(map(_has_non_finite, value.values()))
+    if isinstance(value, (list, tuple)):
+        return any(map(_has_non_finite, value))
+    return False
+
+
+def _encode_json(record: dict, indent: int | None) -> bytes:
+    """Encode one record as UTF-8 JSON without escaping non-ASCII text.
+
+    orjson is used when installed, except for records it would encode
+    differently from ``json.dumps`` (NaN/Infinity, which orjson writes as
+    null) or cannot encode at all (e.g. integers wider than 64 bits).
+    """
+    if orjson is not None and indent == 2 and not _has_non_finite(record):
+        try:
+            return orjson.dumps(
+                record, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(record, indent=indent, ensure_ascii=False).encode("utf-8")
+
+
+def _write_json_array(f: IO[bytes], records: Iterable[dict], indent: int | None) -> int:
+    """Write ``records`` to ``f`` as a JSON array, one record at a time.
+
+    The output matches ``json.dump(list(records), f, indent=indent)``
+    without ever holding the whole array or its encoding in memory.
+
+    Returns:
+        The number of records written.
+    """
+    if indent is None:
+        pad = None
+        start, sep, end = b"[", b", ", b"]"
+    else:
+        # Encoded JSON never contains raw newlines inside strings, so each
+        # record's lines can be shifted one level deeper with a replace.
+        pad = b"\n" + b" " * indent
+        start, sep, end = b"[" + pad, b"," + pad, b"\n]"
+
+    count = 0
+    for count, record in enumerate(records, 1):
+        f.write(start if count == 1 else sep)
+        chunk = _encode_json(record, indent)
+        f.write(chunk if pad is None else chunk.replace(b"\n", pad))
+    f.write(end if count else b"[]")
+    return count
+
+
 def export_to_json(
-    events: list[EventData],
+    events: Iterable[EventData],
     filepath: str | Path,
     indent: int = 2,
 ) -> Path:
-    """Export a list of events to a JSON file.
+    """Export events to a JSON file.
+
+    Records are encoded and written one at a time, so ``events`` may be
+    any iterable. Paths ending in ``.gz`` are written gzip-compressed.
 
     Args:
-        events: List of Event objects or enriched dicts.
+        events: Event objects or enriched dicts.
         filepath: Output file path.
         indent: JSON indentation level.
 
@@ -37,49 +142,99 @@ def export_to_json(
         The Path to the written file.
     """
     filepath = Path(filepath)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent(filepath)
+
+    records = (_to_dict(event) for event in events)
+    if filepath.suffix == ".gz":
+        # Level 1 keeps most of the size win at a fraction of the CPU cost
+        with gzip.open(filepath, "wb", compresslevel=1) as f:
+            count = _write_json_array(f, records, indent)
+    else:
+        with open(filepath, "wb") as f:
+            count = _write_json_array(f, records, indent)
+
+    logger.info("Exported %d events to %s", count, filepath)
+    return filepath
 
-    data = [_to_dict(event) for event in events]
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
 
-    logger.info("Exported %d events to %s", len(events), filepath)
-    return filepath
+def _write_csv(f: IO[str], events: Iterable[EventData]) -> int:
+    """Write ``events`` to the text stream ``f`` as CSV rows.
+
+    Returns:
+        The number of rows written, excluding the header.
+    """
+    rows = (_to_dict(event) for event in events)
+    first = next(rows, None)
+    if first is None:
+        return 0
+
+    fieldnames = list(first.keys())
+    # Pull every column out of a row in one C-level call
+    getter = _row_getter(fieldnames)
+    fieldset = frozenset(fieldnames)
+    # List columns (e.g. tags) are joined as comma-separated strings for CSV.
+    # Rows normally share one schema, so find candidates once from the first
+    # row; a None there may still be a list in later rows.
+    list_cols = [
+        i for i, v in enumerate(getter(first)) if v is None or isinstance(v, list)
+    ]
+
+    count = 0
+
+    def _values() -> Iterator[list]:
+        nonlocal count
+        for row in chain([first], rows):
+            if row.keys() == fieldset:
+                values = list(getter(row))
+                for i in list_cols:
+                    if isinstance(values[i], list):
+                        values[i] = ", ".join(values[i])
+                # A list in a column that held a scalar in the first row;
+                # the type scan runs in C, so the common case stays cheap
+                if list in map(type, values):
+                    values = [
+                        ", ".join(v) if isinstance(v, list) else v for v in values
+                    ]
+            else:
+                # Mixed Event/dict input: fall back to DictWriter semantics
+                values = _irregular_row(row, fieldnames, fieldset)
+            count += 1
+            yield values
+
+    writer = csv.writer(f)
+    writer.writerow(fieldnames)
+    # writerows drives the generator from C, one call for all rows
+    writer.writerows(_values())
+    return count
 
 
 def export_to_csv(
-    events: list[EventData],
-    filepath: str | Path,
-) -> Path:
-    """Export a list of events to a CSV file.
+    events: Iterable[EventData],
+    filepath: str | Path | IO[str],
+) -> Path | IO[str]:
+    """Export events to a CSV file or text stream.
+
+    Rows are written as they are read, so ``events`` may be any iterable.
 
     Args:
-        events: List of Event objects or enriched dicts.
-        filepath: Output file path.
+        events: Event objects or enriched dicts.
+        filepath: Output file path, or an open text stream (e.g.
+                  ``io.StringIO``) to write to instead. Streams should be
+                  opened with ``newline=""``.
 
     Returns:
-        The Path to the written file.
+        The Path to the written file, or the stream it was given.
     """
-    filepath = Path(filepath)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-
-    if not events:
+    if hasattr(filepath, "write"):
+        count = _write_csv(filepath, events)
+    else:
+        filepath = Path(filepath)
+        _ensure_parent(filepath)
+        with open(filepath, "w", newline="", encoding="utf-8") as f:
+            count = _write_csv(f, events)
+
+    if count:
+        logger.info("Exported %d events to %s", count, filepath)
+    else:
         logger.warning("No events to export.")
-        filepath.write_text("", encoding="utf-8")
-        return filepath
-
-    rows = [_to_dict(event) for event in events]
-    fieldnames = list(rows[0].keys())
-
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            # Convert any list values to comma-separated strings for CSV
-            row = {
-                k: (", ".join(v) if isinstance(v, list) else v) for k, v in row.items()
-            }
-            writer.writerow(row)
-
-    logger.info("Exported %d events to %s", len(events), filepath)
     return filepath
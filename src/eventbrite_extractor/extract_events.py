@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 import sys
 from pathlib import Path
@@ -12,10 +13,6 @@ from eventbrite_extractor.config import NYC_PLACE_ID
 from eventbrite_extractor.export import export_to_csv, export_to_json
 from eventbrite_extractor.transform import transform_events
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
@@ -24,8 +21,12 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
 def _build_parser() -> argparse.ArgumentParser:
-    """Build and return the CLI argument parser."""
+    """Build and return the CLI argument parser.
+
+    Cached, so repeated in-process ``main()`` calls reuse one parser.
+    """
     parser = argparse.ArgumentParser(
         description="Extract AI events from Eventbrite.",
     )
@@ -75,6 +76,11 @@ def _build_parser() -> argparse.ArgumentParser:
         default="both",
         help="Output format (default: both).",
     )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Write JSON output gzip-compressed (events.json.gz).",
+    )
     parser.add_argument(
         "-o",
         "--output-dir",
@@ -102,11 +108,13 @@ def _export_events(
     enriched: list[dict],
     output_dir: str,
     fmt: str,
+    compress: bool = False,
 ) -> None:
     """Write enriched event dicts to the requested file format(s)."""
     out = Path(output_dir)
     if fmt in ("json", "both"):
-        path = export_to_json(enriched, out / "events.json")
+        json_name = "events.json.gz" if compress else "events.json"
+        path = export_to_json(enriched, out / json_name)
         logger.info("JSON saved to %s", path)
     if fmt in ("csv", "both"):
         path = export_to_csv(enriched, out / "events.csv")
@@ -117,6 +125,8 @@ def _export_events(
 # Terminal summary
 # ---------------------------------------------------------------------------
 
+_BAR = "=" * 64
+
 
 def _print_summary(
     enriched: list[dict],
@@ -124,17 +134,23 @@ def _print_summary(
     location_label: str,
 ) -> None:
     """Print a human-readable event listing to stdout."""
-    print(f"\n{'=' * 64}")
-    print(f"  {len(enriched)} events in {location_label} (from {raw_count} raw)")
-    print(f"{'=' * 64}\n")
-
+    lines = [
+        "",
+        _BAR,
+        f"  {len(enriched)} events in {location_label} (from {raw_count} raw)",
+        _BAR,
+        "",
+    ]
     for i, ev in enumerate(enriched, 1):
-        print(f"  {i}. [{ev['event_type']}] {ev['title']}")
-        print(f"     {ev['display_date']}")
-        print(f"     {ev['display_location']}")
-        print(f"     {ev['display_price']}")
-        print(f"     {ev['url']}")
-        print()
+        lines.append(f"  {i}. [{ev['event_type']}] {ev['title']}")
+        lines.append(f"     {ev['display_date']}")
+        lines.append(f"     {ev['display_location']}")
+        lines.append(f"     {ev['display_price']}")
+        lines.append(f"     {ev['url']}")
+        lines.append("")
+
+    # One write instead of several print() calls per event
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -144,6 +160,12 @@ def _print_summary(
 
 def main(argv: list[str] | None = None) -> None:
     """Run the event extraction pipeline."""
+    # Configured here rather than at import so importing this module does
+    # not reconfigure the host application's root logger.
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
     args = _build_parser().parse_args(argv)
     place_id, location_label = _resolve_location(args.place_id)
 
@@ -184,7 +206,7 @@ def main(argv: list[str] | None = None) -> None:
     logger.info("%d events after transform. Exporting...", len(enriched))
 
     # --- Export (enriched data, not raw) ---
-    _export_events(enriched, args.output_dir, args.format)
+    _export_events(enriched, args.output_dir, args.format, compress=args.gzip)
 
     # --- Print summary ---
     _print_summary(enriched, raw_count=len(raw_events), location_label=location_label)
@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 
+# __slots__ drops the per-instance __dict__; dataclass(slots=True)
+# needs Python 3.10+, so 3.9 falls back to a regular dataclass.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _intern(value: str | None) -> str | None:
+    """Intern a low-cardinality string so events share one copy."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Event:
     """Structured representation of an Eventbrite event.
 
@@ -47,25 +58,28 @@ class Event:
         Returns:
             An Event instance with fields populated from the API data.
         """
+        get = data.get
+
+        # Expanded sub-objects; "or {}" also covers explicit nulls
+        ticket_info = get("ticket_availability") or {}
+        organizer = get("primary_organizer") or {}
+        venue = get("primary_venue") or {}
+        image = get("image") or {}
+
         # Ticket availability (present when expanded)
-        ticket_info = data.get("ticket_availability", {})
         is_free = ticket_info.get("is_free", False)
         price = None
         currency = None
-        if not is_free and ticket_info:
-            min_price = ticket_info.get("minimum_ticket_price", {})
+        if not is_free:
+            min_price = ticket_info.get("minimum_ticket_price")
             if min_price:
                 price = min_price.get("major_value")
-                currency = min_price.get("currency")
+                currency = _intern(min_price.get("currency"))
 
-        # Organizer (present when expanded)
-        organizer = data.get("primary_organizer", {})
-
-        # Venue (present when expanded)
-        venue = data.get("primary_venue", {})
+        # Venue address (present when expanded)
         venue_address = None
         if venue:
-            addr = venue.get("address", {})
+            addr = venue.get("address") or {}
             parts = [
                 addr.get("city"),
                 addr.get("region"),
@@ -73,48 +87,51 @@ class Event:
             ]
             venue_address = ", ".join(p for p in parts if p) or None
 
-        # Image (present when expanded)
-        image = data.get("image", {})
-
-        # Tags — extract display names
-        tags = [
-            tag.get("display_name", "")
-            for tag in data.get("tags", [])
-            if tag.get("display_name")
-        ]
-
-        # Category — first tag with prefix "EventbriteCategory"
+        # Tags — display names, plus the category: the first tag with
+        # prefix "EventbriteCategory". Both come from one pass.
+        tags: list[str] = []
         category = None
-        for tag in data.get("tags", []):
-            if tag.get("prefix") == "EventbriteCategory":
-                category = tag.get("display_name")
-                break
+        for tag in get("tags") or ():
+            name = tag.get("display_name")
+            if name:
+                tags.append(name)
+                if category is None and tag.get("prefix") == "EventbriteCategory":
+                    category = _intern(name)
 
         return cls(
-            event_id=data.get("id", ""),
-            title=data.get("name", ""),
-            summary=data.get("summary"),
-            start_date=data.get("start_date"),
-            start_time=data.get("start_time"),
-            end_date=data.get("end_date"),
-            end_time=data.get("end_time"),
-            timezone=data.get("timezone"),
-            is_online=data.get("is_online_event", False),
-            venue_name=venue.get("name") if venue else None,
+            event_id=get("id", ""),
+            title=get("name", ""),
+            summary=get("summary"),
+            start_date=get("start_date"),
+            start_time=get("start_time"),
+            end_date=get("end_date"),
+            end_time=get("end_time"),
+            timezone=_intern(get("timezone")),
+            is_online=get("is_online_event", False),
+            venue_name=venue.get("name"),
             venue_address=venue_address,
-            organizer_name=(organizer.get("name") if organizer else None),
-            organizer_id=(organizer.get("id") if organizer else None),
-            url=data.get("url"),
+            organizer_name=organizer.get("name"),
+            organizer_id=organizer.get("id"),
+            url=get("url"),
             is_free=is_free,
             price=price,
             currency=currency,
             category=category,
             tags=tags,
-            image_url=image.get("url") if image else None,
-            is_cancelled=bool(data.get("is_cancelled")),
-            published=data.get("published"),
+            image_url=image.get("url"),
+            is_cancelled=bool(get("is_cancelled")),
+            published=get("published"),
         )
 
     def to_dict(self) -> dict:
         """Convert the Event to a plain dictionary."""
-        return asdict(self)
+        data = dict(zip(_FIELD_NAMES, _get_field_values(self)))
+        # Copy the one mutable field so the dict never aliases the Event
+        data["tags"] = list(self.tags)
+        return data
+
+
+# Field order and a C-level getter for to_dict(); avoids asdict()'s
+# recursive deep copy of every value.
+_FIELD_NAMES = tuple(f.name for f in fields(Event))
+_get_field_values = attrgetter(*_FIELD_NAMES)
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from datetime import date, datetime
+import re
+from datetime import date, datetime, time
+from operator import itemgetter
+from typing import Callable
 
 from eventbrite_extractor.models import Event
 
@@ -73,6 +77,88 @@ _CATEGORY_KEYWORDS: dict[str, list[str]] = {
     ],
 }
 
+# One alternation per category, kept in priority order, so classification
+# is a single regex scan per category rather than one substring test per
+# keyword. Matching is still plain substring matching.
+_CATEGORY_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+    (category, re.compile("|".join(map(re.escape, keywords))))
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+]
+
+
+# Zero-padded API formats. For these fromisoformat parses exactly like
+# strptime; anything else takes the strptime path so lenient inputs such
+# as "2026-3-5" or "9:30" keep working on every Python version.
+_ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_ISO_TIME_RE = re.compile(r"[0-9]{2}:[0-9]{2}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(value: str) -> date:
+    """Parse a ``%Y-%m-%d`` string, caching repeats across events.
+
+    Raises:
+        ValueError: If the string is not a valid date in that format.
+    """
+    if _ISO_DATE_RE.fullmatch(value):
+        return date.fromisoformat(value)
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _parse_time(value: str) -> time:
+    """Parse a ``%H:%M`` string.
+
+    Raises:
+        ValueError: If the string is not a valid time in that format.
+    """
+    if _ISO_TIME_RE.fullmatch(value):
+        return time.fromisoformat(value)
+    return datetime.strptime(value, "%H:%M").time()
+
+
+def _keep_event(
+    event: Event,
+    remove_cancelled: bool,
+    remove_past: bool,
+    today: date,
+    debug: bool = False,
+) -> bool:
+    """Return True if ``event`` survives the cancelled/past filters.
+
+    ``debug`` is ``logger.isEnabledFor(DEBUG)``, checked once by the
+    caller so per-event debug logging costs nothing when disabled.
+    """
+    if remove_cancelled and event.is_cancelled:
+        if debug:
+            logger.debug("Filtered out cancelled event: %s", event.title)
+        return False
+
+    if remove_past and event.start_date:
+        try:
+            if _parse_date(event.start_date) < today:
+                if debug:
+                    logger.debug(
+                        "Filtered out past event: %s (%s)",
+                        event.title,
+                        event.start_date,
+                    )
+                return False
+        except ValueError:
+            logger.warning(
+                "Unparseable date '%s' for event: %s — keeping it.",
+                event.start_date,
+                event.title,
+            )
+
+    return True
+
+
+def _log_filtered(original_count: int, remaining: int) -> None:
+    """Log how many events the filter step dropped, if any."""
+    removed = original_count - remaining
+    if removed:
+        logger.info("Filtered out %d events (%d remaining).", removed, remaining)
+
 
 def filter_events(
     events: list[Event],
@@ -92,37 +178,33 @@ def filter_events(
         Filtered list of events.
     """
     today = reference_date or date.today()
-    original_count = len(events)
-    result: list[Event] = []
+    debug = logger.isEnabledFor(logging.DEBUG)
+    result = [
+        event
+        for event in events
+        if _keep_event(event, remove_cancelled, remove_past, today, debug)
+    ]
+    _log_filtered(len(events), len(result))
+    return result
 
-    for event in events:
-        if remove_cancelled and event.is_cancelled:
-            logger.debug("Filtered out cancelled event: %s", event.title)
-            continue
 
-        if remove_past and event.start_date:
-            try:
-                event_date = datetime.strptime(event.start_date, "%Y-%m-%d").date()
-                if event_date < today:
-                    logger.debug(
-                        "Filtered out past event: %s (%s)",
-                        event.title,
-                        event.start_date,
-                    )
-                    continue
-            except ValueError:
-                logger.warning(
-                    "Unparseable date '%s' for event: %s — keeping it.",
-                    event.start_date,
-                    event.title,
-                )
+def _make_sort_key(by: str, free_first: bool) -> Callable[[Event], tuple]:
+    """Return the sort key function used by ``sort_events``."""
 
-        result.append(event)
+    def _sort_key(event: Event) -> tuple:
+        free_rank = 0 if (free_first and event.is_free) else 1
 
-    removed = original_count - len(result)
-    if removed:
-        logger.info("Filtered out %d events (%d remaining).", removed, len(result))
-    return result
+        if by == "title":
+            return (free_rank, event.title.lower())
+
+        # Default: sort by date, then time
+        return (
+            free_rank,
+            event.start_date or "9999-99-99",
+            event.start_time or "99:99",
+        )
+
+    return _sort_key
 
 
 def sort_events(
@@ -140,21 +222,35 @@ def sort_events(
     Returns:
         Sorted list of events.
     """
-
-    def _sort_key(event: Event) -> tuple:
-        free_rank = 0 if (free_first and event.is_free) else 1
-
-        if by == "title":
-            return (free_rank, event.title.lower())
-
-        # Default: sort by date, then time
-        return (
-            free_rank,
-            event.start_date or "9999-99-99",
-            event.start_time or "99:99",
-        )
-
-    return sorted(events, key=_sort_key)
+    return sorted(events, key=_make_sort_key(by, free_first))
+
+
+# Plain ASCII decimal prices such as "50", "50.00" or "5.04"; other digit
+# scripts fall through to float(), which normalises them
+_PRICE_RE = re.compile(r"([0-9]+)(?:\.([0-9]{1,2}))?")
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_amount(price: str, currency: str) -> str:
+    """Format a price string for display, e.g. "50.00" -> "$50 USD"."""
+    # Strip trailing zeros for clean display (50.00 -> $50, 5.04 -> $5.04)
+    match = _PRICE_RE.fullmatch(price)
+    if match:
+        # Common case: trim the digits directly, no float round-trip
+        whole = match.group(1).lstrip("0") or "0"
+        cents = (match.group(2) or "").rstrip("0")
+        if whole == "0" and not cents:
+            return "Free"
+        formatted = f"{whole}.{cents}" if cents else whole
+    else:
+        try:
+            amount = float(price)
+        except ValueError:
+            return price
+        if amount == 0:
+            return "Free"
+        formatted = f"{amount:.2f}".rstrip("0").rstrip(".")
+    return f"${formatted} {currency}"
 
 
 def format_price(event: Event) -> str:
@@ -166,20 +262,52 @@ def format_price(event: Event) -> str:
         return "Free"
 
     if event.price is not None:
-        # Strip trailing zeros for clean display (50.00 -> $50, 5.04 -> $5.04)
-        try:
-            amount = float(event.price)
-            if amount == 0:
-                return "Free"
-            formatted = f"{amount:.2f}".rstrip("0").rstrip(".")
-            currency = event.currency or "USD"
-            return f"${formatted} {currency}"
-        except ValueError:
-            return event.price
+        return _format_amount(event.price, event.currency or "USD")
 
     return "Paid"
 
 
+# English names indexed by date.weekday() / date.month - 1; fixed tables
+# avoid locale-dependent strftime calls on every event.
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _display_day(value: str) -> str:
+    """Format a ``YYYY-MM-DD`` string as e.g. "Wed, Mar 4"."""
+    try:
+        d = _parse_date(value)
+    except ValueError:
+        return value
+    return f"{_WEEKDAYS[d.weekday()]}, {_MONTHS[d.month - 1]} {d.day}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _display_time(value: str) -> str:
+    """Format an ``HH:MM`` string as e.g. "at 2:30 PM"."""
+    try:
+        t = _parse_time(value)
+    except ValueError:
+        return f"at {value}"
+    hour = t.hour % 12 or 12
+    ampm = "AM" if t.hour < 12 else "PM"
+    return f"at {hour}:{t.minute:02d} {ampm}"
+
+
 def format_date_display(event: Event) -> str:
     """Return a human-readable date string for an event.
 
@@ -188,23 +316,10 @@ def format_date_display(event: Event) -> str:
     parts: list[str] = []
 
     if event.start_date:
-        try:
-            dt = datetime.strptime(event.start_date, "%Y-%m-%d")
-            # e.g. "Wed, Mar 4"
-            day = dt.day  # int, no zero-padding
-            parts.append(f"{dt.strftime('%a, %b')} {day}")
-        except ValueError:
-            parts.append(event.start_date)
+        parts.append(_display_day(event.start_date))
 
     if event.start_time:
-        try:
-            t = datetime.strptime(event.start_time, "%H:%M")
-            hour = t.hour % 12 or 12
-            minute = t.strftime("%M")
-            ampm = "AM" if t.hour < 12 else "PM"
-            parts.append(f"at {hour}:{minute} {ampm}")
-        except ValueError:
-            parts.append(f"at {event.start_time}")
+        parts.append(_display_time(event.start_time))
 
     return " ".join(parts) if parts else "Date TBD"
 
@@ -224,16 +339,16 @@ def classify_event(event: Event) -> str:
     Returns one of: Conference, Workshop, Meetup, Webinar, Hackathon,
     Talk, Course, or "Event" as a fallback.
     """
-    parts = [event.title.lower()]
+    # Join first, then lowercase the whole buffer in one call
+    parts = [event.title]
     if event.summary:
-        parts.append(event.summary.lower())
-    parts.extend(tag.lower() for tag in event.tags)
-    searchable = " ".join(parts)
+        parts.append(event.summary)
+    parts.extend(event.tags)
+    searchable = " ".join(parts).lower()
 
-    for category, keywords in _CATEGORY_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in searchable:
-                return category
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(searchable):
+            return category
 
     return "Event"
 
@@ -250,8 +365,10 @@ def transform_events(
 
     Steps:
         1. Filter out cancelled and past events
-        2. Sort by date (or title), optionally free-first
-        3. Enrich each event with formatted display fields and category
+        2. Enrich each event with formatted display fields and category
+        3. Sort by date (or title), optionally free-first
+
+    Filtering and enrichment happen in a single pass over ``events``.
 
     Args:
         events: Raw Event objects from the extractor.
@@ -264,26 +381,27 @@ def transform_events(
     Returns:
         List of enriched event dicts with display-ready fields.
     """
-    # Step 1: Filter
-    filtered = filter_events(
-        events,
-        remove_cancelled=remove_cancelled,
-        remove_past=remove_past,
-        reference_date=reference_date,
-    )
-
-    # Step 2: Sort
-    sorted_events = sort_events(filtered, by=sort_by, free_first=free_first)
+    today = reference_date or date.today()
+    debug = logger.isEnabledFor(logging.DEBUG)
+    sort_key = _make_sort_key(sort_by, free_first)
 
-    # Step 3: Enrich
-    enriched: list[dict] = []
-    for event in sorted_events:
+    # Filter and enrich in one pass, remembering each event's sort key so
+    # the enriched dicts can be ordered without a second walk over events.
+    keyed: list[tuple[tuple, dict]] = []
+    for event in events:
+        if not _keep_event(event, remove_cancelled, remove_past, today, debug):
+            continue
         data = event.to_dict()
         data["display_price"] = format_price(event)
         data["display_date"] = format_date_display(event)
         data["display_location"] = format_location(event)
         data["event_type"] = classify_event(event)
-        enriched.append(data)
+        keyed.append((sort_key(event), data))
+    _log_filtered(len(events), len(keyed))
+
+    # Stable sort on the key alone; dicts are never compared
+    keyed.sort(key=itemgetter(0))
+    enriched = [data for _, data in keyed]
 
     logger.info(
         "Transform complete: %d events → %d enriched records.",
@@ -0,0 +1,29 @@
+"""Shared pytest fixtures."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _load_fixture(name: str) -> dict:
+    """Load a JSON payload from ``tests/fixtures``."""
+    return json.loads((FIXTURES_DIR / name).read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="session")
+def sample_event() -> dict:
+    """A destination/search event payload.
+
+    Loaded once per session and shared, so tests must not mutate it;
+    build variants with ``sample_event | {...}`` instead.
+    """
+    return _load_fixture("eventbrite_event.json")
+
+
+@pytest.fixture(scope="session")
+def sample_search_response() -> dict:
+    """A single-page destination/search response (shared, read-only)."""
+    return _load_fixture("eventbrite_search.json")
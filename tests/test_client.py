@@ -1,70 +1,148 @@
 """Tests for the Eventbrite API client."""
 
-from unittest.mock import MagicMock, patch
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
 
 import pytest
-
-from eventbrite_extractor.client import EventbriteClient
-
-# Sample event matching the real destination/search response format
-SAMPLE_EVENT = {
-    "id": "111",
-    "name": "AI Workshop",
-    "summary": "A workshop about AI.",
-    "start_date": "2026-04-01",
-    "start_time": "10:00",
-    "end_date": "2026-04-01",
-    "end_time": "12:00",
-    "timezone": "UTC",
-    "is_online_event": False,
-    "primary_venue": {
-        "name": "Test Venue",
-        "address": {"city": "Boston", "region": "MA", "country": "US"},
-    },
-    "primary_organizer": {"name": "Test Org", "id": "org1"},
-    "url": "https://www.eventbrite.com/e/111",
-    "ticket_availability": {
-        "is_free": True,
-        "has_available_tickets": True,
-        "is_sold_out": False,
-    },
-    "tags": [
-        {
-            "prefix": "EventbriteCategory",
-            "display_name": "Science & Technology",
-        },
-    ],
-    "image": {"url": "https://img.example.com/logo.png"},
-    "published": "2026-01-10T08:00:00Z",
-}
-
-SAMPLE_SEARCH_RESPONSE = {
-    "events": {
-        "results": [SAMPLE_EVENT],
-        "pagination": {
-            "object_count": 1,
-            "page_size": 20,
-        },
-    },
-}
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.response import HTTPResponse
+
+from eventbrite_extractor.client import (
+    _ADAPTER,
+    _BACKOFF_JITTER,
+    _MAX_RETRY_DELAY,
+    _RETRY,
+    _RETRY_AFTER_JITTER,
+    EventbriteClient,
+)
+from eventbrite_extractor.config import BASE_URL, get_api_key
+
+
+class FakeEventbriteAdapter(BaseAdapter):
+    """Transport adapter that serves canned JSON instead of calling the API.
+
+    Mounted on a fresh session, it exercises the client's real request
+    path (headers, status handling, decoding) without any network I/O.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._routes: dict[tuple[str, str], list[tuple[int, dict]]] = {}
+        self.requests: list[requests.PreparedRequest] = []
+
+    def register(self, method, endpoint, *payloads, status_code=200):
+        """Queue JSON responses for ``method`` requests to ``endpoint``.
+
+        ``bytes`` payloads are served as-is, for malformed bodies.
+
+        Responses are served in order; the last one repeats once the
+        others are used up.
+        """
+        queue = self._routes.setdefault((method, endpoint), [])
+        queue.extend((status_code, payload) for payload in payloads)
+
+    @property
+    def last_json(self) -> dict:
+        """The JSON body of the most recent request."""
+        return json.loads(self.requests[-1].body)
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        endpoint = request.url[len(BASE_URL) :].split("?")[0]
+        queue = self._routes.get((request.method, endpoint))
+        if not queue:
+            raise AssertionError(f"Unexpected request: {request.method} {endpoint}")
+        status_code, payload = queue.pop(0) if len(queue) > 1 else queue[0]
+
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers["Content-Type"] = "application/json"
+        if isinstance(payload, bytes):
+            response._content = payload
+        else:
+            response._content = json.dumps(payload).encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def api():
+    """Fake Eventbrite transport; register responses per test."""
+    return FakeEventbriteAdapter()
+
+
+@pytest.fixture
+def client(api):
+    """Client whose requests are served by the ``api`` fixture."""
+    session = requests.Session()
+    session.mount(BASE_URL, api)
+    client = EventbriteClient(api_key="fake_token")
+    client._session = session
+    return client
+
+
+class _QueuedStatusHandler(BaseHTTPRequestHandler):
+    """Serve the next status queued on the server, with an empty JSON body."""
+
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        body = b"{}"
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def retrying_client():
+    """Client that retries through ``_RETRY`` against a local HTTP server.
+
+    Yields ``(client, server)``; queue statuses on ``server.statuses`` and
+    inspect ``server.paths`` for the attempts made. Backoff sleeps are
+    patched out.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _QueuedStatusHandler)
+    server.statuses = []
+    server.paths = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    session = requests.Session()
+    session.trust_env = False
+    session.mount("http://", HTTPAdapter(max_retries=_RETRY))
+    client = EventbriteClient(api_key="fake_token")
+    client._session = session
+
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    with (
+        patch("eventbrite_extractor.client.BASE_URL", base_url),
+        patch("urllib3.util.retry.time.sleep"),
+    ):
+        yield client, server
+
+    server.shutdown()
+    server.server_close()
 
 
 class TestEventbriteClient:
     """Tests for the EventbriteClient."""
 
-    def _make_client(self):
-        """Create a client with a fake API key."""
-        return EventbriteClient(api_key="fake_token")
-
-    def test_search_events_returns_events(self):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_SEARCH_RESPONSE
-        mock_response.raise_for_status = MagicMock()
-
-        client = self._make_client()
-        client._session = MagicMock()
-        client._session.request.return_value = mock_response
+    def test_search_events_returns_events(self, api, client, sample_search_response):
+        api.register("POST", "/destination/search/", sample_search_response)
 
         events = client.search_events(keyword="AI")
         assert len(events) == 1
@@ -73,30 +151,23 @@ class TestEventbriteClient:
         assert events[0].venue_name == "Test Venue"
         assert events[0].venue_address == "Boston, MA, US"
 
-    def test_search_events_deduplicates(self):
+    def test_search_events_deduplicates(self, api, client, sample_event):
         """Duplicate events in results should be deduplicated."""
         response = {
             "events": {
-                "results": [SAMPLE_EVENT, SAMPLE_EVENT],
+                "results": [sample_event, sample_event],
                 "pagination": {
                     "object_count": 2,
                     "page_size": 20,
                 },
             },
         }
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = response
-        mock_response.raise_for_status = MagicMock()
-
-        client = self._make_client()
-        client._session = MagicMock()
-        client._session.request.return_value = mock_response
+        api.register("POST", "/destination/search/", response)
 
         events = client.search_events(keyword="AI")
         assert len(events) == 1
 
-    def test_search_events_empty_response(self):
+    def test_search_events_empty_response(self, api, client):
         empty_response = {
             "events": {
                 "results": [],
@@ -106,23 +177,16 @@ class TestEventbriteClient:
                 },
             },
         }
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = empty_response
-        mock_response.raise_for_status = MagicMock()
-
-        client = self._make_client()
-        client._session = MagicMock()
-        client._session.request.return_value = mock_response
+        api.register("POST", "/destination/search/", empty_response)
 
         events = client.search_events(keyword="nonexistent")
         assert len(events) == 0
 
-    def test_search_events_pagination(self):
+    def test_search_events_pagination(self, api, client, sample_event):
         """Test that continuation-based pagination works."""
         page1 = {
             "events": {
-                "results": [SAMPLE_EVENT],
+                "results": [sample_event],
                 "pagination": {
                     "object_count": 2,
                     "page_size": 1,
@@ -130,7 +194,7 @@ class TestEventbriteClient:
                 },
             },
         }
-        event2 = {**SAMPLE_EVENT, "id": "222", "name": "AI Talk"}
+        event2 = sample_event | {"id": "222", "name": "AI Talk"}
         page2 = {
             "events": {
                 "results": [event2],
@@ -140,76 +204,69 @@ class TestEventbriteClient:
                 },
             },
         }
-
-        mock_resp1 = MagicMock()
-        mock_resp1.status_code = 200
-        mock_resp1.json.return_value = page1
-        mock_resp1.raise_for_status = MagicMock()
-
-        mock_resp2 = MagicMock()
-        mock_resp2.status_code = 200
-        mock_resp2.json.return_value = page2
-        mock_resp2.raise_for_status = MagicMock()
-
-        client = self._make_client()
-        client._session = MagicMock()
-        client._session.request.side_effect = [mock_resp1, mock_resp2]
+        api.register("POST", "/destination/search/", page1, page2)
 
         events = client.search_events(keyword="AI", max_pages=2)
         assert len(events) == 2
         assert events[0].event_id == "111"
         assert events[1].event_id == "222"
+        assert api.last_json["event_search"]["continuation"] == "eyJwYWdlIjoyfQ"
 
-    def test_get_event_by_id(self):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_EVENT
-        mock_response.raise_for_status = MagicMock()
-
-        client = self._make_client()
-        client._session = MagicMock()
-        client._session.request.return_value = mock_response
+    def test_get_event_by_id(self, api, client, sample_event):
+        api.register("GET", "/events/111/", sample_event)
 
         event = client.get_event_by_id("111")
         assert event.event_id == "111"
         assert event.title == "AI Workshop"
 
-    def test_search_events_includes_place_id(self):
+    def test_search_events_includes_place_id(self, api, client, sample_search_response):
         """Default search should include NYC place ID."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_SEARCH_RESPONSE
-        mock_response.raise_for_status = MagicMock()
-
-        client = self._make_client()
-        client._session = MagicMock()
-        client._session.request.return_value = mock_response
+        api.register("POST", "/destination/search/", sample_search_response)
 
         client.search_events(keyword="AI")
 
-        call_args = client._session.request.call_args
-        body = call_args.kwargs.get("json") or call_args[1].get("json")
+        body = api.last_json
         assert "places" in body["event_search"]
         assert body["event_search"]["places"] == ["85977539"]
 
-    def test_search_events_no_place_id(self):
+    def test_search_events_no_place_id(self, api, client, sample_search_response):
         """Passing place_id=None should omit places from search."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_SEARCH_RESPONSE
-        mock_response.raise_for_status = MagicMock()
-
-        client = self._make_client()
-        client._session = MagicMock()
-        client._session.request.return_value = mock_response
+        api.register("POST", "/destination/search/", sample_search_response)
 
         client.search_events(keyword="AI", place_id=None)
 
-        call_args = client._session.request.call_args
-        body = call_args.kwargs.get("json") or call_args[1].get("json")
-        assert "places" not in body["event_search"]
+        assert "places" not in api.last_json["event_search"]
+
+    def test_clients_share_connection_pool(self):
+        first = EventbriteClient(api_key="fake_token")
+        second = EventbriteClient("other")
+        assert first._session.get_adapter(BASE_URL) is _ADAPTER
+        assert second._session.get_adapter(BASE_URL) is _ADAPTER
+
+    def test_clients_do_not_share_cookies(self):
+        first = EventbriteClient(api_key="fake_token")
+        second = EventbriteClient("other")
+        assert first._session is not second._session
+        first._session.cookies.set("session", "abc")
+        assert "session" not in second._session.cookies
+
+    def test_auth_header_sent_per_request(self, api, client, sample_event):
+        api.register("GET", "/events/111/", sample_event)
+
+        client.get_event_by_id("111")
+
+        headers = api.requests[-1].headers
+        assert headers["Authorization"] == "Bearer fake_token"
+        assert "Content-Type" not in headers
+
+    def test_invalid_json_raises_requests_error(self, api, client):
+        api.register("GET", "/events/111/", b"<html>Bad Gateway</html>")
+        with pytest.raises(requests.JSONDecodeError) as exc_info:
+            client.get_event_by_id("111")
+        assert isinstance(exc_info.value, requests.RequestException)
 
     def test_client_requires_api_key(self):
+        get_api_key.cache_clear()
         with (
             patch.dict("os.environ", {}, clear=True),
             patch(
@@ -219,3 +276,78 @@ class TestEventbriteClient:
             pytest.raises(ValueError, match="EVENTBRITE_API_KEY"),
         ):
             EventbriteClient()
+
+    def test_api_key_lookup_is_cached(self):
+        get_api_key.cache_clear()
+        with patch(
+            "eventbrite_extractor.config.os.getenv",
+            return_value="env_token",
+        ) as mock_getenv:
+            assert EventbriteClient()._api_key == "env_token"
+            assert EventbriteClient()._api_key == "env_token"
+        assert mock_getenv.call_count == 1
+        get_api_key.cache_clear()
+
+
+class TestRetries:
+    """Tests for the adapter-level retry policy."""
+
+    def test_session_adapter_uses_retry_policy(self):
+        assert _ADAPTER.max_retries is _RETRY
+
+    @pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+    def test_retries_rate_limit_and_server_errors(self, status):
+        assert _RETRY.is_retry("POST", status)
+        assert _RETRY.is_retry("GET", status)
+
+    @pytest.mark.parametrize("status", [400, 401, 404])
+    def test_does_not_retry_client_errors(self, status):
+        assert not _RETRY.is_retry("POST", status)
+
+    def test_retry_after_is_clamped_and_jittered(self):
+        response = HTTPResponse(status=429, headers={"Retry-After": "900"})
+        delays = {_RETRY.get_retry_after(response) for _ in range(20)}
+        assert all(
+            _MAX_RETRY_DELAY <= d <= _MAX_RETRY_DELAY + _RETRY_AFTER_JITTER
+            for d in delays
+        )
+        assert len(delays) > 1
+
+    def test_first_retry_backs_off(self):
+        retry = _RETRY.increment(
+            method="GET", url="/", response=HTTPResponse(status=429)
+        )
+        delays = {retry.get_backoff_time() for _ in range(20)}
+        assert all(1.0 <= d <= 1.0 + _BACKOFF_JITTER for d in delays)
+        assert len(delays) > 1
+
+    def test_backoff_is_capped(self):
+        retry = _RETRY.new(total=20)
+        for _ in range(10):
+            retry = retry.increment(
+                method="GET", url="/", response=HTTPResponse(status=503)
+            )
+        delay = retry.get_backoff_time()
+        assert _MAX_RETRY_DELAY <= delay <= _MAX_RETRY_DELAY * (1 + _BACKOFF_JITTER)
+
+    def test_raises_http_error_on_error_status(self, api, client):
+        api.register("GET", "/events/111/", {}, status_code=404)
+        with pytest.raises(requests.HTTPError):
+            client.get_event_by_id("111")
+
+    def test_retries_rate_limited_requests(self, retrying_client, caplog):
+        client, server = retrying_client
+        server.statuses[:] = [429, 503]
+        with caplog.at_level(logging.WARNING, logger="eventbrite_extractor.client"):
+            client.get_event_by_id("111")
+        assert server.paths == ["/events/111/"] * 3
+        assert "Rate limited. Retrying (2 attempts left)" in caplog.text
+        assert "HTTP 503" in caplog.text
+
+    def test_raises_http_error_after_retries(self, retrying_client):
+        client, server = retrying_client
+        server.statuses[:] = [429] * 10
+        with pytest.raises(requests.HTTPError):
+            client.get_event_by_id("111")
+        # One initial attempt plus _RETRY.total retries
+        assert len(server.paths) == 1 + _RETRY.total
@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+import copy
 import csv
+import gzip
+import io
 import json
+import shutil
 from pathlib import Path
 
+import pytest
+
 from eventbrite_extractor.export import export_to_csv, export_to_json
 from eventbrite_extractor.models import Event
 
 
-def _make_events() -> list[Event]:
-    """Create sample events for testing."""
+@pytest.fixture(scope="module")
+def events() -> list[Event]:
+    """Sample events, shared by every test in the module.
+
+    The exporters only read their input, so one list is safe to share.
+    """
     return [
         Event(
             event_id="1",
@@ -36,22 +46,32 @@ def _make_events() -> list[Event]:
     ]
 
 
+@pytest.fixture(scope="module")
+def json_export(events, tmp_path_factory) -> tuple[Path, list[dict]]:
+    """Export the sample events to JSON once; return the path and parsed data."""
+    out = export_to_json(events, tmp_path_factory.mktemp("json") / "events.json")
+    return out, json.loads(out.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module")
+def csv_export(events, tmp_path_factory) -> tuple[Path, list[dict]]:
+    """Export the sample events to CSV once; return the path and parsed rows."""
+    out = export_to_csv(events, tmp_path_factory.mktemp("csv") / "events.csv")
+    with open(out, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    return out, rows
+
+
 class TestExportJson:
     """Tests for JSON export."""
 
-    def test_export_creates_file(self, tmp_path: Path):
-        events = _make_events()
-        out = tmp_path / "events.json"
-        result = export_to_json(events, out)
-        assert result == out
+    def test_export_creates_file(self, json_export):
+        out, _ = json_export
+        assert out.name == "events.json"
         assert out.exists()
 
-    def test_export_json_content(self, tmp_path: Path):
-        events = _make_events()
-        out = tmp_path / "events.json"
-        export_to_json(events, out)
-
-        data = json.loads(out.read_text(encoding="utf-8"))
+    def test_export_json_content(self, json_export):
+        _, data = json_export
         assert len(data) == 2
         assert data[0]["event_id"] == "1"
         assert data[0]["title"] == "AI Workshop"
@@ -64,48 +84,160 @@ class TestExportJson:
         data = json.loads(out.read_text(encoding="utf-8"))
         assert data == []
 
-    def test_export_creates_parent_dirs(self, tmp_path: Path):
+    def test_export_json_matches_stdlib_format(self, events, json_export):
+        out, _ = json_export
+        expected = json.dumps(
+            [e.to_dict() for e in events], indent=2, ensure_ascii=False
+        )
+        assert out.read_text(encoding="utf-8") == expected
+
+    def test_export_json_matches_stdlib_for_unusual_values(self, tmp_path: Path):
+        records = [
+            {"counts": {2026: 3, 2027: 1}},
+            {"big": 2**70},
+            {"score": float("nan"), "max": float("inf")},
+        ]
+        out = tmp_path / "unusual.json"
+        export_to_json(records, out)
+
+        expected = json.dumps(records, indent=2, ensure_ascii=False)
+        assert out.read_text(encoding="utf-8") == expected
+
+    def test_export_json_custom_indent(self, events, tmp_path: Path):
+        out = tmp_path / "events.json"
+        export_to_json(events, out, indent=4)
+
+        content = out.read_text(encoding="utf-8")
+        assert content.startswith("[\n    {")
+        assert len(json.loads(content)) == 2
+
+    def test_export_from_generator(self, events, tmp_path: Path):
+        out = tmp_path / "events.json"
+        export_to_json((event for event in events), out)
+
+        data = json.loads(out.read_text(encoding="utf-8"))
+        assert [d["event_id"] for d in data] == ["1", "2"]
+
+    def test_export_gzip(self, events, tmp_path: Path):
+        out = tmp_path / "events.json.gz"
+        export_to_json(events, out)
+
+        with gzip.open(out, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        assert [d["event_id"] for d in data] == ["1", "2"]
+
+    def test_export_creates_parent_dirs(self, events, tmp_path: Path):
         out = tmp_path / "sub" / "dir" / "events.json"
-        export_to_json(_make_events(), out)
+        export_to_json(events, out)
+        assert out.exists()
+
+    def test_export_recreates_deleted_dir(self, events, tmp_path: Path):
+        out = tmp_path / "sub" / "events.json"
+        export_to_json(events, out)
+        shutil.rmtree(out.parent)
+        export_to_json(events, out)
         assert out.exists()
 
 
 class TestExportCsv:
     """Tests for CSV export."""
 
-    def test_export_creates_file(self, tmp_path: Path):
-        events = _make_events()
-        out = tmp_path / "events.csv"
-        result = export_to_csv(events, out)
-        assert result == out
+    def test_export_creates_file(self, csv_export):
+        out, _ = csv_export
+        assert out.name == "events.csv"
         assert out.exists()
 
-    def test_export_csv_content(self, tmp_path: Path):
-        events = _make_events()
-        out = tmp_path / "events.csv"
-        export_to_csv(events, out)
-
-        with open(out, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
+    def test_export_csv_content(self, csv_export):
+        _, rows = csv_export
         assert len(rows) == 2
         assert rows[0]["event_id"] == "1"
         assert rows[0]["title"] == "AI Workshop"
         assert rows[1]["price"] == "50.00"
 
-    def test_export_csv_tags_as_string(self, tmp_path: Path):
-        events = _make_events()
+    def test_export_csv_tags_as_string(self, csv_export):
+        _, rows = csv_export
+        assert rows[1]["tags"] == "Conference, Tech"
+
+    def test_export_from_generator(self, events, tmp_path: Path):
         out = tmp_path / "events.csv"
+        export_to_csv((event for event in events), out)
+
+        with open(out, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [r["event_id"] for r in rows] == ["1", "2"]
+
+    def test_export_does_not_mutate_events(self, events, tmp_path: Path):
+        before = copy.deepcopy(events)
+        export_to_csv(events, tmp_path / "events.csv")
+        export_to_json(events, tmp_path / "events.json")
+        assert events == before
+
+    def test_export_does_not_mutate_input(self, events, tmp_path: Path):
+        rows = [event.to_dict() for event in events]
+        export_to_csv(rows, tmp_path / "events.csv")
+        assert rows[1]["tags"] == ["Conference", "Tech"]
+
+    def test_export_single_column_dicts(self, tmp_path: Path):
+        out = tmp_path / "ids.csv"
+        export_to_csv([{"event_id": "1"}, {"event_id": "2"}], out)
+        assert out.read_text(encoding="utf-8").splitlines() == ["event_id", "1", "2"]
+
+    def test_export_recreates_deleted_dir(self, events, tmp_path: Path):
+        out = tmp_path / "sub" / "events.csv"
+        export_to_csv(events, out)
+        shutil.rmtree(out.parent)
         export_to_csv(events, out)
+        assert out.exists()
 
+    def test_export_fills_missing_columns(self, tmp_path: Path):
+        out = tmp_path / "partial.csv"
+        export_to_csv([{"a": "1", "b": ["x", "y"]}, {"a": "3"}], out)
+        with open(out, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert rows == [{"a": "1", "b": "x, y"}, {"a": "3", "b": ""}]
+
+    def test_export_rejects_unexpected_columns(self, events, tmp_path: Path):
+        enriched = events[1].to_dict() | {"display_price": "$50 USD"}
+        with pytest.raises(ValueError, match="display_price"):
+            export_to_csv([events[0], enriched], tmp_path / "mixed.csv")
+
+    def test_export_joins_lists_after_empty_first_value(self, tmp_path: Path):
+        out = tmp_path / "tags.csv"
+        export_to_csv(
+            [
+                {"id": "1", "tags": None, "topic": "s"},
+                {"id": "2", "tags": ["a", "b"], "topic": ["p", "q"]},
+            ],
+            out,
+        )
         with open(out, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+            rows = list(csv.DictReader(f))
+        assert [r["tags"] for r in rows] == ["", "a, b"]
+        assert [r["topic"] for r in rows] == ["s", "p, q"]
 
-        assert rows[1]["tags"] == "Conference, Tech"
+    def test_export_rows_without_columns(self):
+        buf = io.StringIO(newline="")
+        export_to_csv([{}, {}], buf)
+
+        expected = io.StringIO(newline="")
+        writer = csv.DictWriter(expected, fieldnames=[])
+        writer.writeheader()
+        writer.writerows([{}, {}])
+        assert buf.getvalue() == expected.getvalue()
 
     def test_export_empty_list(self, tmp_path: Path):
         out = tmp_path / "empty.csv"
         export_to_csv([], out)
         assert out.read_text(encoding="utf-8") == ""
+
+    def test_export_to_stream(self, events, csv_export):
+        out, rows = csv_export
+        buf = io.StringIO(newline="")
+        assert export_to_csv(events, buf) is buf
+        assert list(csv.DictReader(io.StringIO(buf.getvalue()))) == rows
+        assert buf.getvalue() == out.read_bytes().decode("utf-8")
+
+    def test_export_empty_list_to_stream(self):
+        buf = io.StringIO()
+        export_to_csv([], buf)
+        assert buf.getvalue() == ""
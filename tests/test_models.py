@@ -1,37 +1,29 @@
 """Tests for event data models."""
 
-from eventbrite_extractor.models import Event
-
+import dataclasses
+import sys
 
-class TestEvent:
-    """Tests for the Event dataclass."""
+import pytest
 
-    def test_create_event_with_required_fields(self):
-        event = Event(event_id="123", title="Test Event")
-        assert event.event_id == "123"
-        assert event.title == "Test Event"
-        assert event.source_platform == "eventbrite"
-
-    def test_default_values(self):
-        event = Event(event_id="1", title="E")
-        assert event.summary is None
-        assert event.is_online is False
-        assert event.is_free is False
-        assert event.is_cancelled is False
-        assert event.tags == []
+from eventbrite_extractor.models import Event
 
-    def test_from_api_response_minimal(self):
-        data = {
+# (case id, destination/search payload, expected Event attributes)
+FROM_API_CASES = [
+    (
+        "minimal",
+        {
             "id": "456",
             "name": "Minimal Event",
-        }
-        event = Event.from_api_response(data)
-        assert event.event_id == "456"
-        assert event.title == "Minimal Event"
-        assert event.source_platform == "eventbrite"
-
-    def test_from_api_response_full(self):
-        data = {
+        },
+        {
+            "event_id": "456",
+            "title": "Minimal Event",
+            "source_platform": "eventbrite",
+        },
+    ),
+    (
+        "full",
+        {
             "id": "789",
             "name": "AI Conference 2026",
             "summary": "A conference about AI.",
@@ -79,63 +71,84 @@ class TestEvent:
                 "url": "https://img.example.com/logo.png",
             },
             "published": "2026-01-15T10:00:00Z",
-        }
-        event = Event.from_api_response(data)
-        assert event.event_id == "789"
-        assert event.title == "AI Conference 2026"
-        assert event.summary == "A conference about AI."
-        assert event.start_date == "2026-03-01"
-        assert event.start_time == "10:00"
-        assert event.end_date == "2026-03-01"
-        assert event.end_time == "17:00"
-        assert event.timezone == "America/New_York"
-        assert event.is_online is False
-        assert event.venue_name == "Convention Center"
-        assert event.venue_address == "New York, NY, US"
-        assert event.organizer_name == "AI Events Co."
-        assert event.organizer_id == "org123"
-        assert event.url == "https://www.eventbrite.com/e/789"
-        assert event.is_free is False
-        assert event.price == "25.00"
-        assert event.currency == "USD"
-        assert event.category == "Science & Technology"
-        assert event.tags == ["Science & Technology", "Conference"]
-        assert event.image_url == "https://img.example.com/logo.png"
-        assert event.published == "2026-01-15T10:00:00Z"
-
-    def test_from_api_response_online_event(self):
-        data = {
+        },
+        {
+            "event_id": "789",
+            "title": "AI Conference 2026",
+            "summary": "A conference about AI.",
+            "start_date": "2026-03-01",
+            "start_time": "10:00",
+            "end_date": "2026-03-01",
+            "end_time": "17:00",
+            "timezone": "America/New_York",
+            "is_online": False,
+            "venue_name": "Convention Center",
+            "venue_address": "New York, NY, US",
+            "organizer_name": "AI Events Co.",
+            "organizer_id": "org123",
+            "url": "https://www.eventbrite.com/e/789",
+            "is_free": False,
+            "price": "25.00",
+            "currency": "USD",
+            "category": "Science & Technology",
+            "tags": ["Science & Technology", "Conference"],
+            "image_url": "https://img.example.com/logo.png",
+            "published": "2026-01-15T10:00:00Z",
+        },
+    ),
+    (
+        "online_event",
+        {
             "id": "100",
             "name": "Online Workshop",
             "is_online_event": True,
-        }
-        event = Event.from_api_response(data)
-        assert event.is_online is True
-
-    def test_from_api_response_free_event(self):
-        data = {
+        },
+        {"is_online": True},
+    ),
+    (
+        "free_event",
+        {
             "id": "200",
             "name": "Free Meetup",
             "ticket_availability": {
                 "is_free": True,
                 "has_available_tickets": True,
             },
-        }
-        event = Event.from_api_response(data)
-        assert event.is_free is True
-        assert event.price is None
-
-    def test_from_api_response_cancelled_event(self):
-        data = {
+        },
+        {"is_free": True, "price": None},
+    ),
+    (
+        "cancelled_event",
+        {
             "id": "300",
             "name": "Cancelled Event",
             "is_cancelled": True,
-        }
-        event = Event.from_api_response(data)
-        assert event.is_cancelled is True
-
-    def test_category_extracted_from_tags(self):
-        data = {
+        },
+        {"is_cancelled": True},
+    ),
+    (
+        "null_expansions",
+        {
+            "id": "500",
+            "name": "Sparse Event",
+            "primary_venue": None,
+            "primary_organizer": None,
+            "ticket_availability": None,
+            "image": None,
+            "tags": None,
+        },
+        {
+            "venue_name": None,
+            "venue_address": None,
+            "organizer_name": None,
+            "image_url": None,
+            "price": None,
+            "tags": [],
+        },
+    ),
+    (
+        "category_from_tags",
+        {
             "id": "400",
             "name": "Tagged Event",
             "tags": [
@@ -148,11 +161,69 @@ class TestEvent:
                     "display_name": "Science & Technology",
                 },
             ],
-        }
-        event = Event.from_api_response(data)
-        assert event.category == "Science & Technology"
-        assert "High Tech" in event.tags
-        assert "Science & Technology" in event.tags
+        },
+        {
+            "category": "Science & Technology",
+            "tags": ["High Tech", "Science & Technology"],
+        },
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def parsed_events() -> dict[str, Event]:
+    """Each FROM_API_CASES payload, parsed once per module."""
+    return {
+        name: Event.from_api_response(payload) for name, payload, _ in FROM_API_CASES
+    }
+
+
+class TestEvent:
+    """Tests for the Event dataclass."""
+
+    def test_create_event_with_required_fields(self):
+        event = Event(event_id="123", title="Test Event")
+        assert event.event_id == "123"
+        assert event.title == "Test Event"
+        assert event.source_platform == "eventbrite"
+
+    def test_default_values(self):
+        event = Event(event_id="1", title="E")
+        assert event.summary is None
+        assert event.is_online is False
+        assert event.is_free is False
+        assert event.is_cancelled is False
+        assert event.tags == []
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="needs slots=True")
+    def test_uses_slots(self):
+        event = Event(event_id="1", title="E")
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.not_a_field = True
+
+    @pytest.mark.parametrize(
+        "name,expected",
+        [(name, expected) for name, _, expected in FROM_API_CASES],
+        ids=[case[0] for case in FROM_API_CASES],
+    )
+    def test_from_api_response(self, parsed_events, name, expected):
+        event = parsed_events[name]
+        for attr, value in expected.items():
+            assert getattr(event, attr) == value, attr
+
+    def test_repeated_strings_are_shared(self):
+        def payload():
+            # Build fresh strings, as a JSON decoder would for each event
+            return {
+                "id": "".join(["6", "0", "0"]),
+                "name": "Interned",
+                "timezone": "/".join(["America", "New_York"]),
+            }
+
+        first = Event.from_api_response(payload())
+        second = Event.from_api_response(payload())
+        assert first.timezone is second.timezone
 
     def test_to_dict(self):
         event = Event(
@@ -166,5 +237,10 @@ class TestEvent:
         assert d["title"] == "Dict Test"
         assert d["tags"] == ["a", "b"]
         assert d["source_platform"] == "eventbrite"
-        assert "event_id" in d
-        assert len(d) == 23
+        assert list(d) == [f.name for f in dataclasses.fields(Event)]
+
+    def test_to_dict_copies_tags(self):
+        event = Event(event_id="1", title="Copy Test", tags=["a"])
+        d = event.to_dict()
+        d["tags"].append("b")
+        assert event.tags == ["a"]
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import dataclasses
+import logging
 from datetime import date
 
+import pytest
+
 from eventbrite_extractor.models import Event
 from eventbrite_extractor.transform import (
     classify_event,
@@ -15,60 +19,105 @@ from eventbrite_extractor.transform import (
     transform_events,
 )
 
+# Reference dates for the past-event filter
+_REF_JAN = date(2026, 1, 1)
+_REF_MAR = date(2026, 3, 1)
+
+# Defaults for _event; copies share its (empty) tags list, which the
+# transform functions only read
+_EVENT_PROTO = Event(
+    event_id="1",
+    title="AI Workshop",
+    start_date="2026-03-15",
+    start_time="10:00",
+)
+
 
 def _event(**kwargs) -> Event:
     """Create an Event with sensible defaults, overridden by kwargs."""
-    defaults = {
-        "event_id": "1",
-        "title": "AI Workshop",
-        "start_date": "2026-03-15",
-        "start_time": "10:00",
-    }
-    defaults.update(kwargs)
-    return Event(**defaults)
-
-
-class TestFilterEvents:
-    """Tests for filter_events."""
+    return dataclasses.replace(_EVENT_PROTO, **kwargs)
+
+
+# Shared input for the transform_events pipeline tests: a free
+# conference, an earlier paid workshop, and a cancelled event
+_PIPELINE_EVENTS = (
+    _event(
+        event_id="1",
+        title="AI Summit",
+        start_date="2026-04-01",
+        start_time="09:00",
+        is_free=True,
+    ),
+    _event(
+        event_id="2",
+        title="AI Workshop",
+        start_date="2026-03-15",
+        start_time="14:00",
+        is_free=False,
+        price="50.00",
+        currency="USD",
+    ),
+    _event(event_id="3", is_cancelled=True),
+)
 
-    def test_removes_cancelled(self):
-        events = [_event(), _event(event_id="2", is_cancelled=True)]
-        result = filter_events(events, reference_date=date(2026, 1, 1))
-        assert len(result) == 1
-        assert result[0].event_id == "1"
 
-    def test_keeps_cancelled_when_disabled(self):
-        events = [_event(is_cancelled=True)]
-        result = filter_events(
-            events, remove_cancelled=False, reference_date=date(2026, 1, 1)
-        )
-        assert len(result) == 1
+# Shared filter_events inputs
+_EV = _event()
+_EV_CANCELLED = _event(event_id="cancelled", is_cancelled=True)
+_EV_PAST = _event(event_id="past", start_date="2025-01-01")
+_EV_FUTURE = _event(event_id="future", start_date="2026-06-01")
+_EV_TODAY = _event(event_id="today", start_date="2026-03-01")
+_EV_NO_DATE = _event(event_id="no_date", start_date=None)
+_EV_UNPARSEABLE = _event(event_id="unparseable", start_date="sometime soon")
+_EV_UNPADDED_PAST = _event(event_id="unpadded", start_date="2026-2-5")
+_EV_BASIC_FORMAT = _event(event_id="basic", start_date="20260205")
 
-    def test_removes_past_events(self):
-        events = [
-            _event(event_id="past", start_date="2025-01-01"),
-            _event(event_id="future", start_date="2026-06-01"),
-        ]
-        result = filter_events(events, reference_date=date(2026, 3, 1))
-        assert len(result) == 1
-        assert result[0].event_id == "future"
-
-    def test_keeps_past_when_disabled(self):
-        events = [_event(start_date="2020-01-01")]
-        result = filter_events(
-            events, remove_past=False, reference_date=date(2026, 3, 1)
-        )
-        assert len(result) == 1
 
-    def test_keeps_events_with_no_date(self):
-        events = [_event(start_date=None)]
-        result = filter_events(events, reference_date=date(2026, 3, 1))
-        assert len(result) == 1
+class TestFilterEvents:
+    """Tests for filter_events."""
 
-    def test_keeps_todays_events(self):
-        events = [_event(start_date="2026-03-01")]
-        result = filter_events(events, reference_date=date(2026, 3, 1))
-        assert len(result) == 1
+    @pytest.mark.parametrize(
+        "events,kwargs,expected",
+        [
+            ([_EV, _EV_CANCELLED], {"reference_date": _REF_JAN}, ["1"]),
+            (
+                [_EV_CANCELLED],
+                {"remove_cancelled": False, "reference_date": _REF_JAN},
+                ["cancelled"],
+            ),
+            ([_EV_PAST, _EV_FUTURE], {"reference_date": _REF_MAR}, ["future"]),
+            (
+                [_EV_PAST],
+                {"remove_past": False, "reference_date": _REF_MAR},
+                ["past"],
+            ),
+            ([_EV_NO_DATE], {"reference_date": _REF_MAR}, ["no_date"]),
+            ([_EV_TODAY], {"reference_date": _REF_MAR}, ["today"]),
+            ([_EV_UNPARSEABLE], {"reference_date": _REF_MAR}, ["unparseable"]),
+            ([_EV_UNPADDED_PAST], {"reference_date": _REF_MAR}, []),
+            ([_EV_BASIC_FORMAT], {"reference_date": _REF_MAR}, ["basic"]),
+        ],
+        ids=[
+            "removes_cancelled",
+            "keeps_cancelled_when_disabled",
+            "removes_past_events",
+            "keeps_past_when_disabled",
+            "keeps_events_with_no_date",
+            "keeps_todays_events",
+            "keeps_unparseable_dates",
+            "parses_unpadded_dates",
+            "rejects_basic_iso_dates",
+        ],
+    )
+    def test_filter_events(self, events, kwargs, expected):
+        result = filter_events(events, **kwargs)
+        assert [e.event_id for e in result] == expected
+
+    def test_logs_filtered_events_at_debug(self, caplog):
+        events = [_event(title="Gone", is_cancelled=True)]
+        with caplog.at_level(logging.DEBUG, logger="eventbrite_extractor.transform"):
+            filter_events(events, reference_date=_REF_JAN)
+        assert "Filtered out cancelled event: Gone" in caplog.text
 
 
 class TestSortEvents:
@@ -114,133 +163,124 @@ class TestSortEvents:
 class TestFormatPrice:
     """Tests for format_price."""
 
-    def test_free_event(self):
-        assert format_price(_event(is_free=True)) == "Free"
-
-    def test_priced_event(self):
-        result = format_price(_event(price="50.00", currency="USD"))
-        assert result == "$50 USD"
-
-    def test_priced_event_with_cents(self):
-        result = format_price(_event(price="5.04", currency="USD"))
-        assert result == "$5.04 USD"
-
-    def test_zero_price_is_free(self):
-        result = format_price(_event(price="0.00", currency="USD"))
-        assert result == "Free"
-
-    def test_no_price_shows_paid(self):
-        assert format_price(_event(is_free=False, price=None)) == "Paid"
-
-    def test_default_currency(self):
-        result = format_price(_event(price="25.00", currency=None))
-        assert result == "$25 USD"
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            ({"is_free": True}, "Free"),
+            ({"price": "50.00", "currency": "USD"}, "$50 USD"),
+            ({"price": "5.04", "currency": "USD"}, "$5.04 USD"),
+            ({"price": "0.00", "currency": "USD"}, "Free"),
+            ({"price": "12.999", "currency": "USD"}, "$13 USD"),
+            ({"price": "Donation", "currency": "USD"}, "Donation"),
+            ({"price": "\u0665\u0660.\u0660\u0660", "currency": "USD"}, "$50 USD"),
+            ({"is_free": False, "price": None}, "Paid"),
+            ({"price": "25.00", "currency": None}, "$25 USD"),
+        ],
+        ids=[
+            "free_event",
+            "priced_event",
+            "priced_event_with_cents",
+            "zero_price_is_free",
+            "fractional_price_rounds_to_cents",
+            "non_numeric_price_shown_raw",
+            "non_ascii_digits_parsed_as_number",
+            "no_price_shows_paid",
+            "default_currency",
+        ],
+    )
+    def test_format_price(self, kwargs, expected):
+        assert format_price(_event(**kwargs)) == expected
 
 
 class TestFormatDateDisplay:
     """Tests for format_date_display."""
 
-    def test_full_date_and_time(self):
-        result = format_date_display(
-            _event(start_date="2026-03-04", start_time="10:00")
-        )
-        assert result == "Wed, Mar 4 at 10:00 AM"
-
-    def test_afternoon_time(self):
-        result = format_date_display(
-            _event(start_date="2026-03-04", start_time="14:30")
-        )
-        assert result == "Wed, Mar 4 at 2:30 PM"
-
-    def test_midnight(self):
-        result = format_date_display(
-            _event(start_date="2026-03-04", start_time="00:00")
-        )
-        assert result == "Wed, Mar 4 at 12:00 AM"
-
-    def test_date_only(self):
-        result = format_date_display(_event(start_date="2026-03-04", start_time=None))
-        assert result == "Wed, Mar 4"
-
-    def test_no_date_or_time(self):
-        result = format_date_display(_event(start_date=None, start_time=None))
-        assert result == "Date TBD"
+    @pytest.mark.parametrize(
+        "start_date,start_time,expected",
+        [
+            ("2026-03-04", "10:00", "Wed, Mar 4 at 10:00 AM"),
+            ("2026-03-04", "14:30", "Wed, Mar 4 at 2:30 PM"),
+            ("2026-03-04", "00:00", "Wed, Mar 4 at 12:00 AM"),
+            ("2026-03-04", None, "Wed, Mar 4"),
+            ("TBA", "noonish", "TBA at noonish"),
+            ("2026-3-4", "9:30", "Wed, Mar 4 at 9:30 AM"),
+            ("20260304", "10", "20260304 at 10"),
+            (None, None, "Date TBD"),
+        ],
+        ids=[
+            "full_date_and_time",
+            "afternoon_time",
+            "midnight",
+            "date_only",
+            "unparseable_values_shown_raw",
+            "unpadded_values",
+            "basic_iso_values_shown_raw",
+            "no_date_or_time",
+        ],
+    )
+    def test_format_date_display(self, start_date, start_time, expected):
+        event = _event(start_date=start_date, start_time=start_time)
+        assert format_date_display(event) == expected
 
 
 class TestFormatLocation:
     """Tests for format_location."""
 
-    def test_online(self):
-        assert format_location(_event(is_online=True)) == "Online"
-
-    def test_venue(self):
-        assert format_location(_event(venue_name="Grand Hall")) == "Grand Hall"
-
-    def test_no_location(self):
-        event = _event(is_online=False, venue_name=None)
-        assert format_location(event) == "Location TBD"
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            ({"is_online": True}, "Online"),
+            ({"venue_name": "Grand Hall"}, "Grand Hall"),
+            ({"is_online": False, "venue_name": None}, "Location TBD"),
+        ],
+        ids=["online", "venue", "no_location"],
+    )
+    def test_format_location(self, kwargs, expected):
+        assert format_location(_event(**kwargs)) == expected
 
 
 class TestClassifyEvent:
     """Tests for classify_event."""
 
-    def test_conference(self):
-        assert classify_event(_event(title="AI Summit 2026")) == "Conference"
-
-    def test_workshop(self):
-        assert classify_event(_event(title="Hands-On AI Workshop")) == "Workshop"
-
-    def test_meetup(self):
-        assert classify_event(_event(title="AI Networking Mixer")) == "Meetup"
-
-    def test_webinar(self):
-        assert classify_event(_event(title="AI Webinar Series")) == "Webinar"
-
-    def test_hackathon(self):
-        assert classify_event(_event(title="AI Hackathon NYC")) == "Hackathon"
-
-    def test_talk(self):
-        assert classify_event(_event(title="Keynote: Future of AI")) == "Talk"
-
-    def test_course(self):
-        assert classify_event(_event(title="AI Fundamentals Course")) == "Course"
-
-    def test_fallback(self):
-        assert classify_event(_event(title="AI and Philosophy")) == "Event"
-
-    def test_uses_summary(self):
-        event = _event(title="Something", summary="Join our networking mixer")
-        assert classify_event(event) == "Meetup"
-
-    def test_uses_tags(self):
-        event = _event(title="Something", tags=["Workshop"])
-        assert classify_event(event) == "Workshop"
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            ({"title": "AI Summit 2026"}, "Conference"),
+            ({"title": "Hands-On AI Workshop"}, "Workshop"),
+            ({"title": "AI Networking Mixer"}, "Meetup"),
+            ({"title": "AI Webinar Series"}, "Webinar"),
+            ({"title": "AI Hackathon NYC"}, "Hackathon"),
+            ({"title": "Keynote: Future of AI"}, "Talk"),
+            ({"title": "AI Fundamentals Course"}, "Course"),
+            ({"title": "AI and Philosophy"}, "Event"),
+            (
+                {"title": "Something", "summary": "Join our networking mixer"},
+                "Meetup",
+            ),
+            ({"title": "Something", "tags": ["Workshop"]}, "Workshop"),
+        ],
+        ids=[
+            "conference",
+            "workshop",
+            "meetup",
+            "webinar",
+            "hackathon",
+            "talk",
+            "course",
+            "fallback",
+            "uses_summary",
+            "uses_tags",
+        ],
+    )
+    def test_classify_event(self, kwargs, expected):
+        assert classify_event(_event(**kwargs)) == expected
 
 
 class TestTransformEvents:
     """Tests for the full transform_events pipeline."""
 
     def test_full_pipeline(self):
-        events = [
-            _event(
-                event_id="1",
-                title="AI Summit",
-                start_date="2026-04-01",
-                start_time="09:00",
-                is_free=True,
-            ),
-            _event(
-                event_id="2",
-                title="AI Workshop",
-                start_date="2026-03-15",
-                start_time="14:00",
-                is_free=False,
-                price="50.00",
-                currency="USD",
-            ),
-            _event(event_id="3", is_cancelled=True),
-        ]
-        result = transform_events(events, reference_date=date(2026, 1, 1))
+        result = transform_events(_PIPELINE_EVENTS, reference_date=_REF_JAN)
 
         # Cancelled event filtered out
         assert len(result) == 2
@@ -257,16 +297,21 @@ class TestTransformEvents:
         assert result[1]["event_type"] == "Conference"
 
     def test_free_first_sorting(self):
-        events = [
-            _event(event_id="paid", start_date="2026-03-01", is_free=False),
-            _event(event_id="free", start_date="2026-04-01", is_free=True),
-        ]
         result = transform_events(
-            events,
+            _PIPELINE_EVENTS,
             free_first=True,
-            reference_date=date(2026, 1, 1),
+            reference_date=_REF_JAN,
         )
-        assert result[0]["event_id"] == "free"
+        # The free April event now leads the paid March one
+        assert [r["event_id"] for r in result] == ["1", "2"]
+
+    def test_ties_keep_input_order(self):
+        events = [
+            _event(event_id="first", title="AI Talk"),
+            _event(event_id="second", title="ai talk"),
+        ]
+        result = transform_events(events, sort_by="title", reference_date=_REF_JAN)
+        assert [r["event_id"] for r in result] == ["first", "second"]
 
     def test_empty_input(self):
         assert transform_events([]) == []